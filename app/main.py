@@ -4,12 +4,22 @@ from __future__ import annotations
 import os
 import sys
 import json
+import time
+import atexit
+import contextlib
+import urllib.parse
 import urllib.request
+import http.client
 import pathlib
 import datetime
 import traceback
 import shutil
-from dataclasses import dataclass
+import ssl
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from typing import List, Optional, Dict, Any, Tuple
 
 import ftplib
@@ -23,6 +33,25 @@ except Exception as e:
 APP_NAME = "AutomationZ Server Backup Scheduler"
 APP_VERSION = "1.0.3"
 
+HELP_TEXT = (
+    "AutomationZ Server Backup Scheduler\n\n"
+    "Automated FTP/FTPS backup tool (remote -> local).\n\n"
+    "Modes:\n"
+    "  - Snapshot: creates timestamped folders (restore points)\n"
+    "  - Mirror: keeps a persistent MIRROR folder (latest state)\n\n"
+    "Profiles = your servers\n"
+    "Backup Jobs = what to download + where + schedule\n\n"
+    "Created by Danny van den Brande\n\n"
+    "AutomationZ Server Backup Scheduler is free and open-source software.\n\n"
+    "If this tool helps you automate server tasks, save time,\n"
+    "or manage multiple servers more easily,\n"
+    "consider supporting development with a donation.\n\n"
+    "Donations are optional, but appreciated and help\n"
+    "support ongoing development and improvements.\n\n"
+    "Support link:\n"
+    "https://ko-fi.com/dannyvandenbrande\n"
+)
+
 BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
 CONFIG_DIR = BASE_DIR / "config"
 DATA_DIR = BASE_DIR / "backups"
@@ -32,40 +61,174 @@ JOBS_PATH = CONFIG_DIR / "backup_jobs.json"
 SETTINGS_PATH = CONFIG_DIR / "settings.json"
 
 DAYS = ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]
+DAY_INDEX = {d: i for i, d in enumerate(DAYS)}
+
+def days_mask(days: List[str]) -> int:
+    """Pack a list of day names into a 7-bit mask (bit i = DAYS[i])."""
+    mask = 0
+    for d in days:
+        i = DAY_INDEX.get(d)
+        if i is not None:
+            mask |= 1 << i
+    return mask
+
+def parse_uint(s: str, default: str) -> int:
+    """Parse a non-negative int from a form field; -1 on invalid input.
+
+    isdecimal() screens the string first — it accepts exactly the digits
+    int() does — so valid input never pays for exception machinery and
+    invalid input never raises.
+    """
+    s = (s or default).strip()
+    return int(s) if s.isdecimal() else -1
 
 def now_stamp() -> str:
     return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
+# One-pass cleanup for remote paths: backslashes become slashes, stray CR/LF
+# are dropped. translate() does all three in a single scan of the string.
+_REMOTE_TRANS = str.maketrans({"\\": "/", "\r": None, "\n": None})
+
 def norm_remote(path: str) -> str:
-    # IMPORTANT: use a single escaped backslash in the python string literal: "\\"
-    p = (path or "").replace("\\", "/" ).replace("\r", "").replace("\n", "")
+    p = (path or "").translate(_REMOTE_TRANS)
     if not p.startswith("/"):
         p = "/" + p
     if len(p) > 1 and p.endswith("/"):
         p = p[:-1]
     return p
 
-def load_json(path: pathlib.Path, default_obj):
+# path -> (mtime_ns, parsed obj, serialized text). Lets the scheduler tick and
+# UI refresh paths skip re-reading/re-parsing configs that have not changed.
+_json_cache: Dict[pathlib.Path, Tuple[int, Any, Optional[str]]] = {}
+
+def load_json(path: pathlib.Path, default_obj, pretty: bool = False):
     if not path.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(default_obj, f, indent=4)
+        save_json(path, default_obj, pretty)
         return default_obj
+    mtime = path.stat().st_mtime_ns
+    entry = _json_cache.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
     with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def save_json(path: pathlib.Path, obj) -> None:
+        obj = json.load(f)
+    _json_cache[path] = (mtime, obj, None)
+    return obj
+
+def save_json(path: pathlib.Path, obj, pretty: bool = False) -> None:
+    # Config files are machine-written far more often than hand-edited;
+    # compact separators keep dumps fast and the files small. Pass
+    # pretty=True for the rare file a user is expected to open.
+    if pretty:
+        data = json.dumps(obj, indent=4)
+    else:
+        data = json.dumps(obj, separators=(",", ":"))
+    save_json_text(path, obj, data)
+
+def save_json_text(path: pathlib.Path, obj, data: str) -> None:
+    """Queue pre-serialized JSON text for writing; obj is its parsed equivalent.
+
+    Serialization happens on the caller (so the snapshot is consistent) but
+    the disk write runs on a background thread, keeping slow filesystems out
+    of the UI and job paths. Queued writes are drained at exit.
+
+    The cache is only updated by _write_json_now once the write lands, so a
+    failed write can never make this skip-unchanged check drop the retry;
+    identical saves queued before the write lands are coalesced per path by
+    the writer thread instead.
+    """
+    entry = _json_cache.get(path)
+    if entry is not None and entry[2] == data and path.exists():
+        return
+    _enqueue_write(path, obj, data)
+
+_io_q: "queue.Queue[Tuple[pathlib.Path, Any, str]]" = queue.Queue()
+_io_thread: Optional[threading.Thread] = None
+_io_thread_lock = threading.Lock()
+
+def _enqueue_write(path: pathlib.Path, obj, data: str) -> None:
+    global _io_thread
+    with _io_thread_lock:
+        if _io_thread is None:
+            _io_thread = threading.Thread(target=_io_writer, daemon=True, name="config-writer")
+            _io_thread.start()
+            atexit.register(_io_q.join)
+    _io_q.put((path, obj, data))
+
+def _io_writer() -> None:
+    while True:
+        items = [_io_q.get()]
+        # Drain whatever else is queued and keep only the newest payload per
+        # path; JSON snapshots carry full state, so superseded writes are
+        # pure wasted IO.
+        while True:
+            try:
+                items.append(_io_q.get_nowait())
+            except queue.Empty:
+                break
+        latest = {path: (obj, data) for path, obj, data in items}
+        for path, (obj, data) in latest.items():
+            try:
+                _write_json_now(path, obj, data)
+            except Exception as e:
+                # The cache still holds what is actually on disk, so the next
+                # save retries instead of skipping as unchanged; report the
+                # failure rather than losing it (no Tk access on this thread).
+                sys.stderr.write(f"[config-writer] failed to write {path}: {e}\n")
+        for _ in items:
+            _io_q.task_done()
+
+def _write_json_now(path: pathlib.Path, obj, data: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=4)
+    # Write to a sibling temp file and rename so a crash mid-write can never
+    # leave a truncated config behind.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    # One encode, one write: no TextIOWrapper layer between us and the file.
+    with open(tmp, "wb") as f:
+        f.write(data.encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _json_cache[path] = (path.stat().st_mtime_ns, obj, data)
+
+# Per-record serialization caches for the profile/job stores: a record only
+# goes back through json.dumps when its fields actually changed since the
+# last save, so saving N records after editing one re-serializes one.
+_profile_json_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
+_job_json_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
+
+def _record_json(cache: Dict[str, Tuple[Dict[str, Any], str]], key: str, d: Dict[str, Any]) -> str:
+    entry = cache.get(key)
+    if entry is not None and entry[0] == d:
+        return entry[1]
+    snap = dict(d)
+    text = json.dumps(snap)
+    cache[key] = (snap, text)
+    return text
+
+def _prune_record_cache(cache: Dict[str, Tuple[Dict[str, Any], str]], live_keys) -> None:
+    for k in list(cache.keys() - set(live_keys)):
+        del cache[k]
 
 class Logger:
+    # Lines are buffered and flushed on a 100 ms timer, so a job that logs
+    # thousands of files costs one Text insert per flush instead of one
+    # configure/insert/see/configure round trip per line.
     def __init__(self, widget: tk.Text):
         self.widget = widget
+        self._pending: List[str] = []
 
     def _append(self, line: str):
+        self._pending.append(line + "\n")
+        if len(self._pending) == 1:
+            self.widget.after(100, self._flush)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
         self.widget.configure(state="normal")
-        self.widget.insert("end", line + "\n")
+        self.widget.insert("end", text)
         self.widget.see("end")
         self.widget.configure(state="disabled")
 
@@ -73,7 +236,7 @@ class Logger:
     def warn(self, msg: str): self._append("[WARN] " + msg)
     def error(self, msg: str): self._append("[ERROR] " + msg)
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     name: str
     host: str
@@ -83,7 +246,7 @@ class Profile:
     tls: bool
     root: str
 
-@dataclass
+@dataclass(slots=True)
 class BackupJob:
     name: str
     enabled: bool
@@ -114,7 +277,12 @@ def load_profiles() -> Tuple[List[Profile], Optional[str]]:
     return profiles, obj.get("active_profile")
 
 def save_profiles(profiles: List[Profile], active: Optional[str]) -> None:
-    save_json(PROFILES_PATH, {"profiles":[p.__dict__ for p in profiles], "active_profile": active})
+    dicts = [asdict(p) for p in profiles]
+    frags = [_record_json(_profile_json_cache, p.name, d) for p, d in zip(profiles, dicts)]
+    _prune_record_cache(_profile_json_cache, (p.name for p in profiles))
+    obj = {"profiles": dicts, "active_profile": active}
+    data = '{"profiles": [' + ", ".join(frags) + '], "active_profile": ' + json.dumps(active) + '}'
+    save_json_text(PROFILES_PATH, obj, data)
 
 def load_jobs() -> List[BackupJob]:
     obj = load_json(JOBS_PATH, {"jobs": []})
@@ -137,21 +305,46 @@ def load_jobs() -> List[BackupJob]:
     return jobs
 
 def save_jobs(jobs: List[BackupJob]) -> None:
-    save_json(JOBS_PATH, {"jobs":[j.__dict__ for j in jobs]})
+    dicts = [asdict(j) for j in jobs]
+    frags = [_record_json(_job_json_cache, j.name, d) for j, d in zip(jobs, dicts)]
+    _prune_record_cache(_job_json_cache, (j.name for j in jobs))
+    obj = {"jobs": dicts}
+    data = '{"jobs": [' + ", ".join(frags) + ']}'
+    save_json_text(JOBS_PATH, obj, data)
 
 def load_settings() -> Dict[str, Any]:
-    return load_json(SETTINGS_PATH, {
+    return load_json(SETTINGS_PATH, pretty=True, default_obj={
         "app": {
             "timeout_seconds": 30,
             "tick_seconds": 20,
-            "auto_start": False
+            "auto_start": False,
+            "transfer_blocksize": 262144,
+            "max_connections": 4,
+            "ranged_threshold_bytes": 268435456,
+            "ranged_parts": 4
         }
     })
 
+@dataclass(slots=True)
+class EntryInfo:
+    # Lightweight analog of os.DirEntry for remote listings: keeps the
+    # classification and size the server already reported so callers never
+    # re-probe an entry the listing has described.
+    name: str
+    is_dir: bool
+    size: Optional[int] = None
+    modify: Optional[str] = None   # MLSD modify fact, YYYYMMDDHHMMSS (UTC)
+
 class FTPClient:
-    def __init__(self, profile: Profile, timeout: int):
+    def __init__(self, profile: Profile, timeout: int, blocksize: int = 262144,
+                 ranged_threshold: int = 0, ranged_parts: int = 4):
         self.p = profile
         self.timeout = timeout
+        self.blocksize = max(8192, int(blocksize))
+        # Files at least ranged_threshold bytes are fetched as ranged_parts
+        # parallel REST/RETR ranges; 0 disables the ranged path.
+        self.ranged_threshold = int(ranged_threshold)
+        self.ranged_parts = max(1, int(ranged_parts))
         self.ftp: Optional[ftplib.FTP] = None
 
     def connect(self):
@@ -190,61 +383,270 @@ class FTPClient:
                 pass
             return False
 
-    def list_dir(self, path: str) -> List[str]:
-        items: List[str] = []
+    def list_dir_facts(self, path: str) -> List[Tuple[str, Dict[str, str]]]:
+        # MLSD already tells us the type/size of every entry; callers should
+        # branch on facts["type"] instead of probing with is_dir(). The NLST
+        # fallback returns empty facts, meaning "unknown, probe if you must".
+        items: List[Tuple[str, Dict[str, str]]] = []
         try:
             for name, facts in self.ftp.mlsd(path):
                 if name in (".", ".."):
                     continue
-                items.append(name)
+                if facts.get("type") in ("cdir", "pdir"):
+                    continue
+                items.append((name, dict(facts)))
             return items
         except Exception:
             pass
         try:
             raw = self.ftp.nlst(path)
-            for r in raw:
-                r = r.replace("\\", "/")
-                items.append(r.split("/")[-1])
-            seen=set(); out=[]
-            for x in items:
-                if x not in seen:
-                    seen.add(x); out.append(x)
-            return out
+            # dict.fromkeys de-duplicates while keeping first-seen order.
+            names = dict.fromkeys(r.replace("\\", "/").rsplit("/", 1)[-1] for r in raw)
+            return [(n, {}) for n in names]
         except Exception:
             return []
 
-    def download_file(self, remote_full: str, local_path: pathlib.Path):
+    def list_entries(self, path: str) -> List[EntryInfo]:
+        out: List[EntryInfo] = []
+        for name, facts in self.list_dir_facts(path):
+            ftype = facts.get("type")
+            if ftype is not None:
+                entry_is_dir = ftype == "dir"
+            else:
+                entry_is_dir = self.is_dir(path.rstrip("/") + "/" + name)
+            size = int(facts["size"]) if "size" in facts else None
+            out.append(EntryInfo(name, entry_is_dir, size, facts.get("modify")))
+        return out
+
+    def walk(self, root: str, include_subdirs: bool = True):
+        # Iterative breadth-first traversal: one listing per directory, no
+        # recursion. Yields (remote_path, entry); directories are yielded as
+        # they are visited, files with whatever metadata the listing gave.
+        pending = deque([root])
+        while pending:
+            rdir = pending.popleft()
+            yield rdir, EntryInfo(rdir.rstrip("/").rsplit("/", 1)[-1], True)
+            for entry in self.list_entries(rdir):
+                remote_child = rdir.rstrip("/") + "/" + entry.name
+                if include_subdirs and entry.is_dir:
+                    pending.append(remote_child)
+                else:
+                    yield remote_child, entry
+
+    def size(self, remote_full: str) -> Optional[int]:
+        try:
+            self.ftp.voidcmd("TYPE I")
+            return self.ftp.size(remote_full)
+        except Exception:
+            return None
+
+    def download_file(self, remote_full: str, local_path: pathlib.Path, size: Optional[int] = None):
+        if (self.ranged_threshold > 0 and self.ranged_parts > 1
+                and size is not None and size >= self.ranged_threshold):
+            self.download_file_ranged(remote_full, local_path, size, self.ranged_parts)
+            return
+        self.download_file_fast(remote_full, local_path)
+
+    def download_file_fast(self, remote_full: str, local_path: pathlib.Path):
+        # Drive the data connection ourselves instead of going through
+        # retrbinary's per-block Python callback. recv_into refills one
+        # preallocated buffer, so a steady-state transfer allocates nothing
+        # and makes exactly one write per block. Works for plain and TLS
+        # sockets alike (SSLSocket implements recv_into too).
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ftp.voidcmd("TYPE I")
+        conn, _ = self.ftp.ntransfercmd("RETR " + remote_full)
+        buf = bytearray(self.blocksize)
+        view = memoryview(buf)
+        try:
+            # buffering=0: blocks go straight to disk, no double-buffer copy.
+            with open(local_path, "wb", buffering=0) as f:
+                while True:
+                    n = conn.recv_into(buf)
+                    if not n:
+                        break
+                    f.write(view[:n])
+            # Shut the TLS layer down cleanly (close_notify) before closing,
+            # as retrbinary does; strict FTPS servers otherwise treat the
+            # transfer as aborted and voidresp() fails a completed download.
+            if isinstance(conn, ssl.SSLSocket):
+                conn.unwrap()
+        finally:
+            conn.close()
+        self.ftp.voidresp()
+
+    def download_file_ranged(self, remote_full: str, local_path: pathlib.Path, total: int, parts: int = 4):
+        # Multiple TCP streams over the same link sidestep per-connection
+        # congestion limits; each worker RETRs with REST <offset> and writes
+        # its disjoint slice of the preallocated file.
+        parts = max(1, min(int(parts), total))
+        chunk = total // parts
         local_path.parent.mkdir(parents=True, exist_ok=True)
         with open(local_path, "wb") as f:
-            self.ftp.retrbinary("RETR " + remote_full, f.write)
+            f.truncate(total)
 
-def weekday_now() -> str:
-    return DAYS[datetime.datetime.now().weekday()]
+        def fetch_range(idx: int):
+            offset = idx * chunk
+            length = total - offset if idx == parts - 1 else chunk
+            cli = FTPClient(self.p, self.timeout, self.blocksize)
+            cli.connect()
+            try:
+                cli.ftp.voidcmd("TYPE I")
+                conn = cli.ftp.transfercmd("RETR " + remote_full, rest=offset)
+                try:
+                    with open(local_path, "r+b") as f:
+                        f.seek(offset)
+                        remaining = length
+                        while remaining > 0:
+                            buf = conn.recv(min(self.blocksize, remaining))
+                            if not buf:
+                                break
+                            f.write(buf)
+                            remaining -= len(buf)
+                        if remaining:
+                            raise EOFError(f"range at offset {offset} ended {remaining} bytes short")
+                finally:
+                    conn.close()
+                try:
+                    # Server reports an aborted transfer (426) for every range
+                    # we cut short on purpose; drain the reply and move on.
+                    cli.ftp.voidresp()
+                except Exception:
+                    pass
+            finally:
+                cli.close()
+
+        with ThreadPoolExecutor(max_workers=parts) as ex:
+            for fut in [ex.submit(fetch_range, i) for i in range(parts)]:
+                fut.result()
+
+class ConnectionPool:
+    """Small pool of FTPClient connections to one server, grown lazily up to `size`."""
+    def __init__(self, profile: Profile, timeout: int, blocksize: int, size: int = 4):
+        self.profile = profile
+        self.timeout = timeout
+        self.blocksize = blocksize
+        self.size = max(1, int(size))
+        self._idle: "queue.Queue[FTPClient]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> FTPClient:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            grow = self._created < self.size
+            if grow:
+                self._created += 1
+        if grow:
+            cli = FTPClient(self.profile, self.timeout, self.blocksize)
+            try:
+                cli.connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            return cli
+        return self._idle.get()
 
-def safe_join_local(root: pathlib.Path, rel: str) -> pathlib.Path:
+    def release(self, cli: FTPClient) -> None:
+        self._idle.put(cli)
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+def mlsd_mtime(modify: Optional[str]) -> Optional[float]:
+    """Convert an MLSD modify fact (UTC YYYYMMDDHHMMSS) to a Unix timestamp."""
+    if not modify:
+        return None
+    try:
+        dt = datetime.datetime.strptime(modify[:14], "%Y%m%d%H%M%S")
+        return dt.replace(tzinfo=datetime.timezone.utc).timestamp()
+    except Exception:
+        return None
+
+def safe_join_local(root_resolved: pathlib.Path, rel: str) -> pathlib.Path:
+    # Callers pass an already-resolve()d root, hoisted out of their download
+    # loops so the realpath walk runs once per job instead of once per file.
     rel = rel.replace("/", os.sep).lstrip(os.sep)
-    out = (root / rel).resolve()
-    rr = root.resolve()
-    if out != rr and rr not in out.parents:
+    out = (root_resolved / rel).resolve()
+    if out != root_resolved and not str(out).startswith(str(root_resolved) + os.sep):
         raise ValueError("Unsafe path: " + rel)
     return out
 
 class App(tk.Tk):
     def _discord_post(self, text: str) -> None:
-        """Send a Discord webhook message if configured."""
+        """Queue a Discord webhook message if configured; never blocks the caller."""
         try:
             dcfg = self.settings.get("discord", {}) if isinstance(self.settings, dict) else {}
             url = (dcfg.get("webhook_url", "") or "").strip()
             if not url:
                 return
-            payload = json.dumps({"content": text}).encode("utf-8")
-            req = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json", "User-Agent": "AutomationZ-Backup/1.0 (+https://github.com/DayZ-AutomationZ)"})
-            urllib.request.urlopen(req, timeout=10).read()
-        except Exception as e:
+            self._discord_q.put((url, text))
+        except Exception:
+            pass
+
+    def _discord_worker(self) -> None:
+        # Single daemon thread drains the queue so webhook latency never sits
+        # on the job path. Messages arriving within 0.5 s are coalesced into
+        # one POST.
+        while True:
+            url, text = self._discord_q.get()
+            parts = [text]
+            deadline = time.monotonic() + 0.5
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nurl, ntext = self._discord_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nurl != url:
+                    self._discord_send(url, "\n".join(parts))
+                    url, parts = nurl, [ntext]
+                    deadline = time.monotonic() + 0.5
+                else:
+                    parts.append(ntext)
+            self._discord_send(url, "\n".join(parts))
+
+    def _discord_send(self, url: str, content: str) -> None:
+        payload = json.dumps({"content": content}).encode("utf-8")
+        headers = {"Content-Type": "application/json", "User-Agent": "AutomationZ-Backup/1.0 (+https://github.com/DayZ-AutomationZ)"}
+        parsed = urllib.parse.urlsplit(url)
+        path = parsed.path + ("?" + parsed.query if parsed.query else "")
+        # Keep one HTTPS connection alive between messages; the first attempt
+        # may hit a server-side idle close, so retry once on a fresh socket.
+        for attempt in (1, 2):
+            conn = self._discord_conn
             try:
-                self.log.warn(f"Discord webhook failed: {e}")
-            except Exception:
-                pass
+                if conn is None or self._discord_conn_host != parsed.netloc:
+                    conn = http.client.HTTPSConnection(parsed.netloc, timeout=10)
+                    self._discord_conn = conn
+                    self._discord_conn_host = parsed.netloc
+                conn.request("POST", path, body=payload, headers=headers)
+                resp = conn.getresponse()
+                resp.read()
+                # urlopen raised on 4xx/5xx; keep that contract so a bad or
+                # revoked webhook URL still lands in the retry/warn path.
+                if resp.status >= 400:
+                    raise RuntimeError(f"HTTP {resp.status} {resp.reason}")
+                return
+            except Exception as e:
+                try:
+                    if conn is not None:
+                        conn.close()
+                except Exception:
+                    pass
+                self._discord_conn = None
+                if attempt == 2:
+                    self._log_async("warn", f"Discord webhook failed: {e}")
 
     def __init__(self):
         super().__init__()
@@ -253,18 +655,39 @@ class App(tk.Tk):
         self.minsize(980, 640)
 
         for p in (CONFIG_DIR, DATA_DIR):
-            p.mkdir(parents=True, exist_ok=True)
+            if not p.is_dir():
+                p.mkdir(parents=True, exist_ok=True)
 
         self.settings = load_settings()
         self.timeout = int(self.settings.get("app",{}).get("timeout_seconds", 30))
         self.tick_seconds = int(self.settings.get("app",{}).get("tick_seconds", 20))
         self.auto_start = bool(self.settings.get("app",{}).get("auto_start", False))
+        self.blocksize = int(self.settings.get("app",{}).get("transfer_blocksize", 262144))
+        self.max_connections = int(self.settings.get("app",{}).get("max_connections", 4))
+        self.ranged_threshold = int(self.settings.get("app",{}).get("ranged_threshold_bytes", 268435456))
+        self.ranged_parts = int(self.settings.get("app",{}).get("ranged_parts", 4))
 
         self.profiles, self.active_profile = load_profiles()
+        self._rebuild_profile_index()
         self.jobs = load_jobs()
+        self._rebuild_schedule_arrays()
 
         self.scheduler_running = False
         self.last_run_key: Dict[str, str] = {}
+        self._profiles_flush_pending = False
+        self._suspend = 0
+        self._last_rendered_profile_idx: Optional[int] = None
+        self._job_line_cache: Dict[int, str] = {}
+        self._combo_names: List[str] = []
+        self._run_lock = threading.Lock()
+        self._profile_locks: Dict[str, threading.Lock] = {}
+        self._job_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="backup-job")
+        self._conn_lock = threading.Lock()
+        self._conn_pool: Dict[str, FTPClient] = {}
+        self._discord_q: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self._discord_conn: Optional[http.client.HTTPSConnection] = None
+        self._discord_conn_host = ""
+        threading.Thread(target=self._discord_worker, daemon=True, name="discord-webhook").start()
 
         nb = ttk.Notebook(self)
         nb.pack(fill="both", expand=True)
@@ -287,11 +710,20 @@ class App(tk.Tk):
         self.log_text.pack(fill="both", expand=True, padx=6, pady=6)
         self.log = Logger(self.log_text)
 
+        # Shared model for the two job listboxes: both bind this variable, so
+        # one set() updates the Jobs tab and the Dashboard in lockstep.
+        self.jobs_lv = tk.Variable(value=())
+
         self._build_dashboard()
         self._build_jobs()
         self._build_profiles()
-        self._build_settings()
-        self._build_help()
+
+        # Settings and Help tabs are built on first view; startup only pays
+        # for the widgets a session actually opens.
+        self._settings_built = False
+        self._help_built = False
+        self.nb = nb
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.refresh_profiles_combo()
         self.refresh_profiles_list()
@@ -315,7 +747,7 @@ class App(tk.Tk):
 
         mid = ttk.LabelFrame(f, text="Jobs")
         mid.pack(fill="both", expand=True, padx=12, pady=(0,10))
-        self.lst_dash_jobs = tk.Listbox(mid, height=18, exportselection=False)
+        self.lst_dash_jobs = tk.Listbox(mid, height=18, exportselection=False, listvariable=self.jobs_lv)
         self.lst_dash_jobs.pack(fill="both", expand=True, padx=8, pady=8)
 
         bot = ttk.Frame(f); bot.pack(fill="x", padx=12, pady=(0,12))
@@ -338,6 +770,7 @@ class App(tk.Tk):
     def stop_scheduler(self):
         self.scheduler_running = False
         self.refresh_status()
+        self._close_idle_clients()
         self.log.warn("Scheduler stopped.")
 
     def _tick(self):
@@ -350,24 +783,34 @@ class App(tk.Tk):
             self.log.error(traceback.format_exc())
         self.after(max(1, self.tick_seconds) * 1000, self._tick)
 
+    def _rebuild_schedule_arrays(self):
+        # Struct-of-arrays mirror of the per-job schedule fields: the 20 s due
+        # check scans flat columns (and a 7-bit day mask) instead of pulling
+        # four attributes off every BackupJob. Rebuilt whenever jobs change.
+        self._job_enabled = [j.enabled for j in self.jobs]
+        self._job_hour = [j.hour for j in self.jobs]
+        self._job_minute = [j.minute for j in self.jobs]
+        self._job_days_mask = [days_mask(j.days) for j in self.jobs]
+
     def check_and_run_due_jobs(self):
         now = datetime.datetime.now()
-        day = weekday_now()
+        day_idx = now.weekday()
+        day = DAYS[day_idx]
+        day_bit = 1 << day_idx
         hh = now.hour
         mm = now.minute
         key_time = f"{day}-{hh:02d}:{mm:02d}"
-        for job in self.jobs:
-            if not job.enabled:
-                continue
-            if day not in job.days:
-                continue
-            if job.hour != hh or job.minute != mm:
-                continue
-            last = self.last_run_key.get(job.name)
-            if last == key_time:
+        for i, job in enumerate(self.jobs):
+            if not (self._job_enabled[i]
+                    and self._job_hour[i] == hh
+                    and self._job_minute[i] == mm
+                    and self._job_days_mask[i] & day_bit):
                 continue
-            self.last_run_key[job.name] = key_time
-            self.run_job(job)
+            with self._run_lock:
+                if self.last_run_key.get(job.name) == key_time:
+                    continue
+                self.last_run_key[job.name] = key_time
+            self._job_executor.submit(self.run_job, job)
 
     def run_selected_job_now(self):
         idx = self._sel_index(self.lst_dash_jobs)
@@ -377,20 +820,61 @@ class App(tk.Tk):
         job = self.jobs[idx]
         if not messagebox.askyesno("Run now", f"Run job '{job.name}' now?"):
             return
-        self.run_job(job)
+        self._job_executor.submit(self.run_job, job)
+
+    def _rebuild_profile_index(self):
+        # name -> Profile; run_job hits this every execution, so keep lookups
+        # O(1) instead of scanning the profile list.
+        self._profile_by_name = {p.name: p for p in self.profiles}
 
     def get_profile(self, name: str) -> Optional[Profile]:
-        for p in self.profiles:
-            if p.name == name:
-                return p
-        return None
+        return self._profile_by_name.get(name)
+
+    def _profile_lock(self, name: str) -> threading.Lock:
+        with self._run_lock:
+            return self._profile_locks.setdefault(name, threading.Lock())
+
+    def _acquire_client(self, p: Profile) -> FTPClient:
+        # Reuse the control connection from the last job on this profile if it
+        # is still alive; back-to-back jobs then skip the TCP/TLS handshake
+        # and login entirely.
+        with self._conn_lock:
+            cli = self._conn_pool.pop(p.name, None)
+        if cli is not None:
+            try:
+                cli.ftp.voidcmd("NOOP")
+                return cli
+            except Exception:
+                cli.close()
+        cli = FTPClient(p, self.timeout, self.blocksize,
+                        ranged_threshold=self.ranged_threshold, ranged_parts=self.ranged_parts)
+        cli.connect()
+        return cli
+
+    def _release_client(self, p: Profile, cli: FTPClient) -> None:
+        if cli.ftp is None:
+            return
+        with self._conn_lock:
+            self._conn_pool[p.name] = cli
+
+    def _close_idle_clients(self) -> None:
+        with self._conn_lock:
+            idle = list(self._conn_pool.values())
+            self._conn_pool.clear()
+        for cli in idle:
+            cli.close()
 
     def run_job(self, job: BackupJob):
+        # Runs on a worker thread so a long backup never freezes the UI.
+        # Jobs on the same profile are serialized; distinct profiles overlap.
         p = self.get_profile(job.profile)
         if not p:
-            self.log.error(f"Job '{job.name}': profile '{job.profile}' not found.")
+            self._log_async("error", f"Job '{job.name}': profile '{job.profile}' not found.")
             return
+        with self._profile_lock(p.name):
+            self._run_job_for_profile(job, p)
 
+    def _run_job_for_profile(self, job: BackupJob, p: Profile):
         remote_root = norm_remote(p.root or "/")
         src = (job.remote_source or "").strip().replace("\r", "").replace("\n", "")
         if src.startswith("/"):
@@ -406,68 +890,114 @@ class App(tk.Tk):
         else:
             dest_root = local_base / p.name / job.name / "MIRROR"
 
-        self.log.info(f"JOB: {job.name} | mode={job.mode} | profile={p.name}")
+        self._log_async("info", f"JOB: {job.name} | mode={job.mode} | profile={p.name}")
+        # Loop-invariant: settings cannot change mid-job, so resolve the
+        # discord section once for start/success/failure alike.
         dcfg = self.settings.get("discord", {}) if isinstance(self.settings, dict) else {}
         if dcfg.get("notify_start", True):
             self._discord_post(f"⏳ Backup started: {job.name} ({p.name})")
-        self.log.info(f"Remote: {remote_full}")
-        self.log.info(f"Local : {dest_root}")
+        self._log_async("info", f"Remote: {remote_full}")
+        self._log_async("info", f"Local : {dest_root}")
         if job.dry_run:
-            self.log.warn("Dry run enabled: no files will be downloaded.")
+            self._log_async("warn", "Dry run enabled: no files will be downloaded.")
 
-        cli = FTPClient(p, self.timeout)
+        cli: Optional[FTPClient] = None
         try:
-            cli.connect()
+            cli = self._acquire_client(p)
             if cli.is_dir(remote_full):
-                self._download_dir(cli, remote_full, dest_root, job, rel_prefix="")
+                self._download_dir(cli, remote_full, dest_root, job)
             else:
                 rel_name = remote_full.split("/")[-1]
-                target = safe_join_local(dest_root, rel_name)
+                target = safe_join_local(dest_root.resolve(), rel_name)
                 if not job.dry_run:
-                    cli.download_file(remote_full, target)
-                self.log.info(f"Downloaded file: {remote_full} -> {target}")
+                    cli.download_file(remote_full, target, size=cli.size(remote_full))
+                self._log_async("info", f"Downloaded file: {remote_full} -> {target}")
 
             if job.mode.lower() == "snapshot" and job.keep_last and job.keep_last > 0:
                 self._cleanup_snapshots(local_base / p.name / job.name, job.keep_last)
 
-            self.log.info(f"JOB DONE: {job.name}")
-            dcfg = self.settings.get("discord", {}) if isinstance(self.settings, dict) else {}
+            self._log_async("info", f"JOB DONE: {job.name}")
             if dcfg.get("notify_success", True):
                 self._discord_post(f"✅ Backup done: {job.name} ({p.name})")
         except Exception as e:
-            self.log.error(f"JOB FAILED: {job.name} -> {e}")
-            dcfg = self.settings.get("discord", {}) if isinstance(self.settings, dict) else {}
+            self._log_async("error", f"JOB FAILED: {job.name} -> {e}")
             if dcfg.get("notify_failure", True):
                 self._discord_post(f"❌ Backup failed: {job.name} ({job.profile}) — {e}")
-            self.log.error(traceback.format_exc())
+            self._log_async("error", traceback.format_exc())
         finally:
-            cli.close()
+            if cli is not None:
+                self._release_client(p, cli)
 
     def _cleanup_snapshots(self, job_dir: pathlib.Path, keep_last: int):
-        if not job_dir.exists():
+        # scandir hands back the type bit from the directory read itself, so
+        # classifying entries needs no extra stat per snapshot folder.
+        try:
+            with os.scandir(job_dir) as it:
+                snaps = [e for e in it if e.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
             return
-        snaps = [d for d in job_dir.iterdir() if d.is_dir()]
-        snaps.sort(key=lambda p: p.name, reverse=True)
-        for d in snaps[keep_last:]:
+        snaps.sort(key=lambda e: e.name, reverse=True)
+        for e in snaps[keep_last:]:
             try:
-                shutil.rmtree(d)
-                self.log.info(f"Cleanup: removed old snapshot {d}")
+                shutil.rmtree(e.path)
+                self._log_async("info", f"Cleanup: removed old snapshot {e.path}")
             except Exception:
-                self.log.warn(f"Cleanup: could not remove {d}")
-
-    def _download_dir(self, cli: FTPClient, remote_dir: str, local_root: pathlib.Path, job: BackupJob, rel_prefix: str):
-        self.log.info(f"Entering folder: {remote_dir}")
-        items = cli.list_dir(remote_dir)
-        for name in items:
-            remote_child = remote_dir.rstrip("/") + "/" + name
-            rel_child = (rel_prefix + "/" + name).lstrip("/")
-            if job.include_subdirs and cli.is_dir(remote_child):
-                self._download_dir(cli, remote_child, local_root, job, rel_child)
+                self._log_async("warn", f"Cleanup: could not remove {e.path}")
+
+    def _log_async(self, level: str, msg: str) -> None:
+        # Tk widgets are main-thread only; worker threads must log via after().
+        self.after(0, lambda: getattr(self.log, level)(msg))
+
+    def _download_dir(self, cli: FTPClient, remote_dir: str, local_root: pathlib.Path, job: BackupJob):
+        # Walk the remote tree first (control channel only), then download the
+        # flat file list on a pool of parallel connections.
+        files: List[Tuple[str, str, EntryInfo]] = []
+        prefix_len = len(remote_dir.rstrip("/"))
+        for remote_path, entry in cli.walk(remote_dir, job.include_subdirs):
+            if entry.is_dir:
+                self._log_async("info", f"Entering folder: {remote_path}")
             else:
-                target = safe_join_local(local_root, rel_child)
-                if not job.dry_run:
-                    cli.download_file(remote_child, target)
-                self.log.info(f"Downloaded: {remote_child} -> {target}")
+                files.append((remote_path, remote_path[prefix_len:].lstrip("/"), entry))
+
+        pool = ConnectionPool(cli.p, self.timeout, self.blocksize, self.max_connections)
+        mirror = job.mode.lower() == "mirror"
+        root_resolved = local_root.resolve()
+
+        def fetch_one(remote_child: str, rel_child: str, entry: EntryInfo):
+            target = safe_join_local(root_resolved, rel_child)
+            remote_mtime = mlsd_mtime(entry.modify)
+            if mirror and entry.size is not None:
+                # The listing already told us size and mtime; if the local
+                # copy matches, the whole transfer is a no-op.
+                try:
+                    st = target.stat()
+                except OSError:
+                    st = None
+                if (st is not None and st.st_size == entry.size
+                        and remote_mtime is not None and int(st.st_mtime) >= int(remote_mtime)):
+                    self._log_async("info", f"Unchanged, skipping: {remote_child}")
+                    return
+            if not job.dry_run:
+                worker = pool.acquire()
+                try:
+                    worker.download_file(remote_child, target, size=entry.size)
+                finally:
+                    pool.release(worker)
+                if remote_mtime is not None:
+                    # Stamp the remote mtime so the next mirror run can compare.
+                    try:
+                        os.utime(target, (remote_mtime, remote_mtime))
+                    except OSError:
+                        pass
+            self._log_async("info", f"Downloaded: {remote_child} -> {target}")
+
+        try:
+            with ThreadPoolExecutor(max_workers=pool.size) as ex:
+                futures = [ex.submit(fetch_one, r, rel, e) for r, rel, e in files]
+                for fut in futures:
+                    fut.result()
+        finally:
+            pool.close_all()
 
     def test_conn(self):
         name = (self.cmb_test_profile.get() or "").strip()
@@ -476,7 +1006,7 @@ class App(tk.Tk):
             messagebox.showwarning("No profile", "Select a profile.")
             return
         self.log.info(f"Testing connection to {p.host}:{p.port} TLS={p.tls}")
-        cli = FTPClient(p, self.timeout)
+        cli = FTPClient(p, self.timeout, self.blocksize)
         try:
             cli.connect()
             self.log.info("Connected. PWD: " + cli.pwd())
@@ -495,7 +1025,7 @@ class App(tk.Tk):
         left = ttk.LabelFrame(outer, text="Backup Jobs")
         left.pack(side="left", fill="both", expand=False)
 
-        self.lst_jobs = tk.Listbox(left, width=52, height=18, exportselection=False)
+        self.lst_jobs = tk.Listbox(left, width=52, height=18, exportselection=False, listvariable=self.jobs_lv)
         self.lst_jobs.pack(fill="both", expand=True, padx=8, pady=8)
         self.lst_jobs.bind("<<ListboxSelect>>", lambda e: self.on_job_select())
 
@@ -569,15 +1099,6 @@ class App(tk.Tk):
         if d:
             self.j_local.set(d)
 
-    def refresh_jobs_list(self):
-        self.lst_jobs.delete(0, "end")
-        self.lst_dash_jobs.delete(0, "end")
-        for j in self.jobs:
-            flag = "ON" if j.enabled else "OFF"
-            line = f"[{flag}] {j.name} | {j.mode} | {','.join(j.days)} {j.hour:02d}:{j.minute:02d} | {j.profile}"
-            self.lst_jobs.insert("end", line)
-            self.lst_dash_jobs.insert("end", line)
-
     def on_job_select(self):
         idx = self._sel_index(self.lst_jobs)
         if idx is None:
@@ -610,6 +1131,7 @@ class App(tk.Tk):
         )
         self.jobs.append(j)
         save_jobs(self.jobs)
+        self._rebuild_schedule_arrays()
         self.refresh_jobs_list()
         self.refresh_profiles_combo()
 
@@ -623,6 +1145,7 @@ class App(tk.Tk):
             return
         del self.jobs[idx]
         save_jobs(self.jobs)
+        self._rebuild_schedule_arrays()
         self.refresh_jobs_list()
 
     def job_save(self):
@@ -630,19 +1153,13 @@ class App(tk.Tk):
         if idx is None:
             messagebox.showwarning("No job", "Select a job.")
             return
-        try:
-            hh = int((self.j_hour.get() or "0").strip())
-            mm = int((self.j_min.get() or "0").strip())
-            if not (0 <= hh <= 23 and 0 <= mm <= 59):
-                raise ValueError()
-        except Exception:
+        hh = parse_uint(self.j_hour.get(), "0")
+        mm = parse_uint(self.j_min.get(), "0")
+        if not (0 <= hh <= 23 and 0 <= mm <= 59):
             messagebox.showerror("Invalid time", "Hour must be 0-23 and Minute must be 0-59.")
             return
-        try:
-            keep = int((self.j_keep.get() or "10").strip())
-            if keep < 0:
-                raise ValueError()
-        except Exception:
+        keep = parse_uint(self.j_keep.get(), "10")
+        if keep < 0:
             messagebox.showerror("Invalid keep", "Keep last snapshots must be 0 or a positive number.")
             return
 
@@ -666,6 +1183,7 @@ class App(tk.Tk):
             dry_run=bool(self.j_dry.get()),
         )
         save_jobs(self.jobs)
+        self._rebuild_schedule_arrays()
         self.refresh_jobs_list()
         messagebox.showinfo("Saved", "Job saved.")
 
@@ -677,7 +1195,10 @@ class App(tk.Tk):
         left = ttk.LabelFrame(outer, text="Profiles")
         left.pack(side="left", fill="both", expand=False)
 
-        self.lst_profiles = tk.Listbox(left, width=28, height=18, exportselection=False)
+        # listvariable-backed: repopulating is a single variable set, so Tk
+        # rebuilds and repaints once however many rows changed.
+        self.profiles_lv = tk.Variable(value=())
+        self.lst_profiles = tk.Listbox(left, width=28, height=18, exportselection=False, listvariable=self.profiles_lv)
         self.lst_profiles.pack(fill="both", expand=True, padx=8, pady=8)
         self.lst_profiles.bind("<<ListboxSelect>>", lambda e: self.on_profile_select())
 
@@ -706,10 +1227,45 @@ class App(tk.Tk):
         actions = ttk.Frame(right); actions.pack(fill="x", padx=10, pady=(0,10))
         ttk.Button(actions, text="Save Changes", command=self.profile_save).pack(side="left")
 
+    def _schedule_persist_profiles(self):
+        # Coalesce bursts of profile mutations into a single save + refresh on
+        # the next idle pass, so rapid clicks don't serialize disk writes with
+        # widget rebuilds on the Tk thread.
+        if self._profiles_flush_pending or self._suspend:
+            return
+        self._profiles_flush_pending = True
+        self.after_idle(self._flush_profiles)
+
+    def _flush_profiles(self):
+        self._profiles_flush_pending = False
+        save_profiles(self.profiles, self.active_profile)
+        self.refresh_profiles_list()
+        self.refresh_profiles_combo()
+
+    @contextlib.contextmanager
+    def bulk_update(self):
+        # Buffer a run of profile mutations: while the context is open every
+        # refresh and persist request is dropped, then a single save + widget
+        # rebuild happens on exit. Nestable; only the outermost exit flushes.
+        self._suspend += 1
+        try:
+            yield
+        finally:
+            self._suspend -= 1
+            if self._suspend == 0:
+                self._flush_profiles()
+
     def refresh_profiles_combo(self):
+        # called before the dashboard/jobs tabs are built? safeguard
+        if self._suspend or getattr(self, "cmb_test_profile", None) is None:
+            return
         names = [p.name for p in self.profiles]
-        self.cmb_test_profile["values"] = names
-        self.cmb_job_profile["values"] = names
+        # Most profile edits (host, credentials, active flag) leave the name
+        # list untouched; only push new option lists into Tk when it changed.
+        if names != self._combo_names:
+            self._combo_names = names
+            self.cmb_test_profile["values"] = names
+            self.cmb_job_profile["values"] = names
         if self.active_profile and self.active_profile in names:
             self.cmb_test_profile.set(self.active_profile)
         elif names:
@@ -718,26 +1274,36 @@ class App(tk.Tk):
             self.j_profile.set(names[0])
 
     def refresh_profiles_list(self):
-        self.lst_profiles.delete(0, "end")
-        for p in self.profiles:
-            suffix = " (active)" if self.active_profile == p.name else ""
-            self.lst_profiles.insert("end", p.name + suffix)
+        # called before the profiles tab is built? safeguard
+        if self._suspend or getattr(self, "profiles_lv", None) is None:
+            return
+        self.profiles_lv.set(tuple(
+            p.name + (" (active)" if self.active_profile == p.name else "")
+            for p in self.profiles
+        ))
 
     def on_profile_select(self):
         idx = self._sel_index(self.lst_profiles)
         if idx is None:
             return
+        # Re-selecting the already rendered row is a no-op; mutation paths
+        # reset the marker so edited data is always re-read into the form.
+        if idx == self._last_rendered_profile_idx:
+            return
+        self._last_rendered_profile_idx = idx
         p = self.profiles[idx]
         self.v_name.set(p.name); self.v_host.set(p.host); self.v_port.set(str(p.port))
         self.v_user.set(p.username); self.v_pass.set(p.password); self.v_tls.set(p.tls); self.v_root.set(p.root)
 
     def profile_new(self):
         n = "Profile_" + str(len(self.profiles) + 1)
-        self.profiles.append(Profile(n, "", 21, "", "", False, "/"))
+        prof = Profile(n, "", 21, "", "", False, "/")
+        self.profiles.append(prof)
         self.active_profile = n
-        save_profiles(self.profiles, self.active_profile)
-        self.refresh_profiles_list()
-        self.refresh_profiles_combo()
+        self._profile_by_name[n] = prof
+        # Flush immediately: the selection below needs the new row in place.
+        self._flush_profiles()
+        self._last_rendered_profile_idx = None
         idx = len(self.profiles) - 1
         self.lst_profiles.selection_clear(0, "end")
         self.lst_profiles.selection_set(idx)
@@ -752,23 +1318,22 @@ class App(tk.Tk):
         if not messagebox.askyesno("Delete", f"Delete profile '{p.name}'?"):
             return
         del self.profiles[idx]
+        self._profile_by_name.pop(p.name, None)
+        self._last_rendered_profile_idx = None
         if self.active_profile == p.name:
             self.active_profile = self.profiles[0].name if self.profiles else None
-        save_profiles(self.profiles, self.active_profile)
-        self.refresh_profiles_list(); self.refresh_profiles_combo()
+        self._schedule_persist_profiles()
 
     def profile_set_active(self):
         idx = self._sel_index(self.lst_profiles)
         if idx is None:
             return
         self.active_profile = self.profiles[idx].name
-        save_profiles(self.profiles, self.active_profile)
-        self.refresh_profiles_list(); self.refresh_profiles_combo()
+        self._schedule_persist_profiles()
 
     def profile_save(self):
-        try:
-            port = int((self.v_port.get() or "21").strip())
-        except ValueError:
+        port = parse_uint(self.v_port.get(), "21")
+        if port <= 0:
             messagebox.showerror("Invalid", "Port must be a number.")
             return
 
@@ -783,26 +1348,28 @@ class App(tk.Tk):
         )
 
         i = self._sel_index(self.lst_profiles)
-        existing_names = [p.name for p in self.profiles]
-
+        # _profile_by_name is kept current by every mutator, so membership is
+        # an O(1) dict probe instead of rebuilding a name list per click.
         if i is None:
-            if new_profile.name in existing_names:
+            if new_profile.name in self._profile_by_name:
                 messagebox.showerror("Duplicate name", "A profile with this name already exists. Pick a different name.")
                 return
             self.profiles.append(new_profile)
+            self._profile_by_name[new_profile.name] = new_profile
             self.active_profile = new_profile.name
         else:
             old_name = self.profiles[i].name
-            if new_profile.name != old_name and new_profile.name in existing_names:
+            if new_profile.name != old_name and new_profile.name in self._profile_by_name:
                 messagebox.showerror("Duplicate name", "A profile with this name already exists. Pick a different name.")
                 return
             self.profiles[i] = new_profile
+            self._profile_by_name.pop(old_name, None)
+            self._profile_by_name[new_profile.name] = new_profile
             if self.active_profile == old_name:
                 self.active_profile = new_profile.name
 
-        save_profiles(self.profiles, self.active_profile)
-        self.refresh_profiles_list()
-        self.refresh_profiles_combo()
+        self._last_rendered_profile_idx = None
+        self._schedule_persist_profiles()
         messagebox.showinfo("Saved", "Profile saved.")
 
     # Settings UI
@@ -815,6 +1382,8 @@ class App(tk.Tk):
         self.s_timeout = tk.StringVar(value=str(self.timeout))
         self.s_tick = tk.StringVar(value=str(self.tick_seconds))
         self.s_auto = tk.BooleanVar(value=self.auto_start)
+        self.s_blocksize = tk.StringVar(value=str(self.blocksize))
+        self.s_maxconn = tk.StringVar(value=str(self.max_connections))
 
         r=0
         ttk.Label(box, text="FTP timeout (seconds)").grid(row=r, column=0, sticky="w", padx=8, pady=6)
@@ -823,68 +1392,85 @@ class App(tk.Tk):
         ttk.Label(box, text="Scheduler tick interval (seconds)").grid(row=r, column=0, sticky="w", padx=8, pady=6)
         ttk.Entry(box, textvariable=self.s_tick, width=8).grid(row=r, column=1, sticky="w", pady=6); r+=1
 
+        ttk.Label(box, text="Transfer block size (bytes)").grid(row=r, column=0, sticky="w", padx=8, pady=6)
+        ttk.Entry(box, textvariable=self.s_blocksize, width=10).grid(row=r, column=1, sticky="w", pady=6); r+=1
+
+        ttk.Label(box, text="Parallel connections per job").grid(row=r, column=0, sticky="w", padx=8, pady=6)
+        ttk.Entry(box, textvariable=self.s_maxconn, width=8).grid(row=r, column=1, sticky="w", pady=6); r+=1
+
         ttk.Checkbutton(box, text="Auto-start scheduler on launch", variable=self.s_auto).grid(row=r, column=0, sticky="w", padx=8, pady=6); r+=1
 
         ttk.Button(outer, text="Save Settings", command=self.save_settings_ui).pack(anchor="w", padx=12, pady=10)
 
     def save_settings_ui(self):
-        try:
-            t = int((self.s_timeout.get() or "30").strip())
-            k = int((self.s_tick.get() or "20").strip())
-            if t <= 0 or k <= 0:
-                raise ValueError()
-        except Exception:
-            messagebox.showerror("Invalid", "Timeout and tick must be positive numbers.")
+        t = parse_uint(self.s_timeout.get(), "30")
+        k = parse_uint(self.s_tick.get(), "20")
+        b = parse_uint(self.s_blocksize.get(), "262144")
+        c = parse_uint(self.s_maxconn.get(), "4")
+        if t <= 0 or k <= 0 or b <= 0 or c <= 0:
+            messagebox.showerror("Invalid", "Timeout, tick, block size and connections must be positive numbers.")
             return
         self.timeout = t
         self.tick_seconds = k
         self.auto_start = bool(self.s_auto.get())
-        self.settings = {"app":{"timeout_seconds": self.timeout, "tick_seconds": self.tick_seconds, "auto_start": self.auto_start}}
-        save_json(SETTINGS_PATH, self.settings)
+        self.blocksize = b
+        self.max_connections = c
+        self.settings = {"app":{"timeout_seconds": self.timeout, "tick_seconds": self.tick_seconds, "auto_start": self.auto_start, "transfer_blocksize": self.blocksize, "max_connections": self.max_connections, "ranged_threshold_bytes": self.ranged_threshold, "ranged_parts": self.ranged_parts}}
+        save_json(SETTINGS_PATH, self.settings, pretty=True)
         messagebox.showinfo("Saved", "Settings saved.")
 
     # Help UI
+    def _on_tab_changed(self, event=None):
+        sel = self.nb.select()
+        if not self._settings_built and sel == str(self.tab_settings):
+            self._settings_built = True
+            self._build_settings()
+        if not self._help_built and sel == str(self.tab_help):
+            self._help_built = True
+            self._build_help()
+
     def _build_help(self):
-        t = tk.Text(self.tab_help, wrap="word")
+        # Insert with wrap off and the final height preset, so Tk neither
+        # wraps mid-insert nor re-measures the widget when it is packed;
+        # word wrap goes back on once the text is in place.
+        t = tk.Text(self.tab_help, wrap="none", height=HELP_TEXT.count("\n") + 1)
+        t.insert("1.0", HELP_TEXT)
+        t.configure(wrap="word", state="disabled")
         t.pack(fill="both", expand=True, padx=12, pady=12)
-        t.insert("1.0",
-            "AutomationZ Server Backup Scheduler\n\n"
-            "Automated FTP/FTPS backup tool (remote -> local).\n\n"
-            "Modes:\n"
-            "  - Snapshot: creates timestamped folders (restore points)\n"
-            "  - Mirror: keeps a persistent MIRROR folder (latest state)\n\n"
-            "Profiles = your servers\n"
-            "Backup Jobs = what to download + where + schedule\n\n"
-            "Created by Danny van den Brande\n\n"
-            "AutomationZ Server Backup Scheduler is free and open-source software.\n\n"
-"If this tool helps you automate server tasks, save time,\n"
-"or manage multiple servers more easily,\n"
-"consider supporting development with a donation.\n\n"
-"Donations are optional, but appreciated and help\n"
-"support ongoing development and improvements.\n\n"
-"Support link:\n"
-"https://ko-fi.com/dannyvandenbrande\n"
-        )
-        t.configure(state="disabled")
+
+    def _format_job(self, j: BackupJob) -> str:
+        # Memoized per instance: every mutation path replaces the BackupJob
+        # object wholesale, so a changed job arrives as a new instance and
+        # misses the cache, while untouched jobs reuse their line for free.
+        # The HH:MM and day-list formatting below therefore runs once per
+        # job lifetime, not once per refresh.
+        key = id(j)
+        line = self._job_line_cache.get(key)
+        if line is None:
+            flag = "ON" if j.enabled else "OFF"
+            line = f"[{flag}] {j.name} | {j.mode} | {','.join(j.days)} {j.hour:02d}:{j.minute:02d} | {j.profile}"
+            self._job_line_cache[key] = line
+        return line
 
     def refresh_jobs_list(self):
-        # called before dashboard build? safeguard
-        if hasattr(self, "lst_jobs") and hasattr(self, "lst_dash_jobs"):
-            self.lst_jobs.delete(0, "end")
-            self.lst_dash_jobs.delete(0, "end")
-            for j in self.jobs:
-                flag = "ON" if j.enabled else "OFF"
-                line = f"[{flag}] {j.name} | {j.mode} | {','.join(j.days)} {j.hour:02d}:{j.minute:02d} | {j.profile}"
-                self.lst_jobs.insert("end", line)
-                self.lst_dash_jobs.insert("end", line)
+        # Prune dropped instances first so a recycled object id can never
+        # resurrect a stale line.
+        cache = self._job_line_cache
+        live = {id(j) for j in self.jobs}
+        for k in list(cache.keys() - live):
+            del cache[k]
+        self.jobs_lv.set(tuple(self._format_job(j) for j in self.jobs))
 
     def _sel_index(self, lb: tk.Listbox) -> Optional[int]:
         sel = lb.curselection()
         return int(sel[0]) if sel else None
 
 def main():
+    # Warm starts skip straight past the stat: both dirs exist after the
+    # first launch, so don't pay the mkdir/EEXIST dance every time.
     for p in (CONFIG_DIR, DATA_DIR):
-        p.mkdir(parents=True, exist_ok=True)
+        if not p.is_dir():
+            p.mkdir(parents=True, exist_ok=True)
     App().mainloop()
 
 if __name__ == "__main__":